@@ -1,26 +1,187 @@
 from PySide2 import QtWidgets, QtCore
-import hou
+import base64
+import concurrent.futures
+import functools
+import http.client
+import queue
+import urllib.parse
 import urllib.request
 import urllib.error
+import weakref
 import json
-import gzip
+import io
 import os
-import platform
+import sqlite3
+from collections import OrderedDict
+from contextlib import closing
 from pathlib import Path
-import hashlib
-import datetime
 
+# Importing this module opens the panel (see show_camdb_floating at the bottom),
+# which imports hou and platform. gzip, zlib, hashlib and datetime are imported
+# where they are used and only load once a code path actually needs them.
+
+try:
+    import brotli  # Optional: lets the server answer with Content-Encoding: br
+except ImportError:
+    brotli = None
+
+try:
+    import orjson  # Optional: parses the camera list several times faster than json
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    orjson = None
+    _loads = json.loads
+    
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+try:
+    import xxhash  # Optional: hashes the camera payload an order of magnitude faster
+except ImportError:
+    xxhash = None
 
 DEBUG_MODE = False  # <-- TOGGLE DEBUGGING HERE
 API_BASE_URL = "https://camdb.matchmovemachine.com"
+ACCEPT_ENCODING = "gzip, deflate, br" if brotli else "gzip, deflate"
+API_TIMEOUT = 30  # seconds
+
+# Sensor prefetch: how many of the listed cameras, with how many
+# parallel requests, and how long (seconds) to wait for the batch
+SENSOR_PREFETCH_LIMIT = 32
+SENSOR_PREFETCH_WORKERS = 8
+SENSOR_PREFETCH_TIMEOUT = 30
+
+# Idle keep-alive API connections kept by the panel, shared by all workers
+API_POOL_SIZE = SENSOR_PREFETCH_WORKERS
+
+# Most recently used sensor lists kept in memory
+SENSOR_CACHE_SIZE = 128
+
+# SQLite cache: one row per camera, so updates only rewrite changed cameras.
+# Rows are keyed by list position so the API list comes back unchanged,
+# whatever type or uniqueness its ids have.
+CAMERAS_CACHE_NAME = "camdb.sqlite"
+CACHE_SCHEMA_VERSION = 2
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cameras (
+    position INTEGER PRIMARY KEY,
+    id,
+    make TEXT,
+    cam_type TEXT,
+    name TEXT,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cameras_id ON cameras (id);
+CREATE INDEX IF NOT EXISTS cameras_make ON cameras (make);
+CREATE INDEX IF NOT EXISTS cameras_cam_type ON cameras (cam_type);
+CREATE TABLE IF NOT EXISTS sensors (
+    camera_id PRIMARY KEY,
+    payload BLOB NOT NULL
+);
+"""
+
+# Cache files written by earlier versions; removed on save and on Clear Cache
+LEGACY_CACHE_NAMES = ("camdb_cameras.json", "camdb_cameras.json.gz")
+
+# QSettings location for persisted UI preferences
+SETTINGS_ORG = "CamDB"
+SETTINGS_APP = "HoudiniCameraBrowser"
+
+# Delay (ms) after the last keystroke before the search filter runs
+SEARCH_DEBOUNCE_MS = 150
 
 def debug_log(*args, **kwargs):
     """Prints messages only if DEBUG_MODE is True."""
     if DEBUG_MODE:
         print("DEBUG:", *args, **kwargs)
 
-# Keep a module-level reference so Python doesn't garbage-collect the window
-camdb_win = None
+def _digest(raw_bytes):
+    """Change-detection hash of a raw API payload"""
+    if xxhash:
+        return xxhash.xxh64(raw_bytes).hexdigest()
+    import hashlib
+    return hashlib.blake2b(raw_bytes, digest_size=8).hexdigest()
+
+def _parse_proxy(proxy):
+    """
+    Split a proxy setting into host[:port] and the CONNECT tunnel headers.
+    Accepts the same forms as urllib's ProxyHandler: the scheme is optional
+    and user:password@ credentials become a Proxy-Authorization header.
+    """
+    if '://' not in proxy:
+        proxy = 'http://' + proxy
+    parts = urllib.parse.urlsplit(proxy)
+    hostport = parts.netloc.rpartition('@')[2]
+    headers = {}
+    if parts.username and parts.password:
+        credentials = f"{urllib.parse.unquote(parts.username)}:{urllib.parse.unquote(parts.password)}"
+        headers['Proxy-Authorization'] = 'Basic ' + base64.b64encode(credentials.encode()).decode('ascii')
+    return hostport, headers
+
+# Weak reference to the open panel. The panel is kept alive by its Qt parent
+# (Houdini's main window); the reference is cleared when the widget is destroyed.
+_camdb_win_ref = None
+
+def _forget_camdb_win(*args):
+    global _camdb_win_ref
+    _camdb_win_ref = None
+
+class ApiWorkerSignals(QtCore.QObject):
+    """Signals used by ApiWorker to deliver results back to the UI thread"""
+    finished = QtCore.Signal(object)
+    error = QtCore.Signal(str)
+
+class ApiWorker(QtCore.QRunnable):
+    """Run a blocking call (network, parsing, hashing) on the Qt thread pool"""
+    def __init__(self, fn, *args):
+        super(ApiWorker, self).__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = ApiWorkerSignals()
+    
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            debug_log(f"Worker {self.fn.__name__} failed: {e}")
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
+class CameraListModel(QtCore.QAbstractListModel):
+    """
+    Serves cameras to the camera QListView without per-row item objects.
+    Rows are indices into the panel's camera list; UserRole returns that index.
+    """
+    def __init__(self, parent=None):
+        super(CameraListModel, self).__init__(parent)
+        self._cameras = []
+        self._rows = []
+    
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+    
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        camera_index = self._rows[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            camera = self._cameras[camera_index]
+            return f"{camera.get('make', 'Unknown')} - {camera.get('name', 'Unknown')}"
+        if role == QtCore.Qt.UserRole:
+            return camera_index
+        return None
+    
+    def setRows(self, cameras, rows):
+        """Replace all rows with a single model reset"""
+        self.beginResetModel()
+        self._cameras = cameras
+        self._rows = rows
+        self.endResetModel()
 
 class CamDBPanel(QtWidgets.QWidget):
     def __init__(self, parent=None):
@@ -31,6 +192,11 @@ class CamDBPanel(QtWidgets.QWidget):
         # Initialize data storage
         self._init_data_storage()
         
+        # hou enum values used on every camera creation, resolved once
+        import hou
+        self._display_comment_flag = hou.nodeFlag.DisplayComment
+        self._scene_viewer_type = hou.paneTabType.SceneViewer
+        
         # Initialize cache system
         self._init_cache_system()
         
@@ -46,14 +212,25 @@ class CamDBPanel(QtWidgets.QWidget):
     def _init_data_storage(self):
         """Initialize data storage variables"""
         self.camera_data = []
-        self.filtered_cameras = []
+        self._filtered_indices = []  # indices into camera_data shown in the list
         self.selected_camera = None
         self.sensor_data = []
+        self._sensor_cache = OrderedDict()  # camera id -> list of sensors, LRU order
+        self._sensor_requests = set()  # camera ids with a sensor request in flight
+        self._connections = queue.LifoQueue(maxsize=API_POOL_SIZE)  # idle keep-alive API connections
+        self._scene_viewer_cache = None
+        
+        # Flat per-camera columns used by filter_cameras, parallel to camera_data
+        self._names_lc = []
+        self._makes = []
+        self._types = []
+        self._sorted_makes = []
+        self._sorted_types = []
     
     def _init_cache_system(self):
         """Initialize cache system with default paths"""
         self.cache_dir = self._get_default_cache_dir()
-        self.cameras_cache_file = self.cache_dir / "camdb_cameras.json"
+        self.cameras_cache_file = self.cache_dir / CAMERAS_CACHE_NAME
         self.cache_info_file = self.cache_dir / "camdb_cache_info.json"
         
         # Ensure cache directory exists
@@ -61,6 +238,7 @@ class CamDBPanel(QtWidgets.QWidget):
     
     def _get_default_cache_dir(self):
         """Get the default cache directory based on OS"""
+        import platform
         system = platform.system()
         
         if system == "Windows":
@@ -129,6 +307,13 @@ class CamDBPanel(QtWidgets.QWidget):
         self.clear_cache_button = QtWidgets.QPushButton("Clear Cache")
         cache_info_layout.addWidget(self.clear_cache_button)
         
+        self.prefetch_sensors_check = QtWidgets.QCheckBox("Prefetch sensors")
+        self.prefetch_sensors_check.setChecked(
+            QtCore.QSettings(SETTINGS_ORG, SETTINGS_APP).value("prefetch_sensors", True, type=bool)
+        )
+        self.prefetch_sensors_check.setToolTip("Fetch sensor data for the listed cameras in the background")
+        cache_info_layout.addWidget(self.prefetch_sensors_check)
+        
         cache_layout.addLayout(cache_info_layout)
         
         # Cache location row
@@ -172,6 +357,11 @@ class CamDBPanel(QtWidgets.QWidget):
         self.search_edit = QtWidgets.QLineEdit()
         self.search_edit.setPlaceholderText("Search camera names...")
         search_layout.addWidget(self.search_edit)
+        
+        # Restarted on every keystroke so typing triggers a single filter pass
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(SEARCH_DEBOUNCE_MS)
         filter_layout.addLayout(search_layout)
         
         filter_layout.addStretch()
@@ -194,8 +384,11 @@ class CamDBPanel(QtWidgets.QWidget):
         left_layout = QtWidgets.QVBoxLayout(left_widget)
         left_layout.addWidget(QtWidgets.QLabel("Cameras:"))
         
-        self.camera_list = QtWidgets.QListWidget()
+        self._camera_model = CameraListModel(self)
+        self.camera_list = QtWidgets.QListView()
         self.camera_list.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.camera_list.setUniformItemSizes(True)
+        self.camera_list.setModel(self._camera_model)
         left_layout.addWidget(self.camera_list)
         
         splitter.addWidget(left_widget)
@@ -235,6 +428,12 @@ class CamDBPanel(QtWidgets.QWidget):
         self.create_camera_button.setEnabled(False)
         right_layout.addWidget(self.create_camera_button)
         
+        settings = QtCore.QSettings(SETTINGS_ORG, SETTINGS_APP)
+        self.auto_look_through_check = QtWidgets.QCheckBox("Auto look-through")
+        self.auto_look_through_check.setToolTip("Look through new cameras without asking")
+        self.auto_look_through_check.setChecked(settings.value("auto_look_through", False, type=bool))
+        right_layout.addWidget(self.auto_look_through_check)
+        
         splitter.addWidget(right_widget)
     
     def _connect_signals(self):
@@ -242,30 +441,30 @@ class CamDBPanel(QtWidgets.QWidget):
         self.load_all_button.clicked.connect(self.load_all_cameras)
         self.make_combo.currentTextChanged.connect(self.filter_cameras)
         self.type_combo.currentTextChanged.connect(self.filter_cameras)
-        self.search_edit.textChanged.connect(self.filter_cameras)
-        self.camera_list.currentItemChanged.connect(self.on_camera_selected)
+        self.search_edit.textChanged.connect(self._schedule_filter)
+        self._filter_timer.timeout.connect(self.filter_cameras)
+        self.camera_list.selectionModel().currentChanged.connect(self.on_camera_selected)
         self.load_sensors_button.clicked.connect(self.load_sensor_data)
         self.sensor_list.currentItemChanged.connect(self.on_sensor_selected)
         self.create_camera_button.clicked.connect(self.create_houdini_camera)
+        self.auto_look_through_check.toggled.connect(self._save_auto_look_through)
         
         # Cache management signals
         self.use_cache_button.clicked.connect(self.use_cached_data)
         self.update_cache_button.clicked.connect(self.update_cache)
+        self.prefetch_sensors_check.toggled.connect(self._save_prefetch_sensors)
         self.clear_cache_button.clicked.connect(self.clear_cache)
         self.browse_cache_button.clicked.connect(self.browse_cache_location)
     
-    def _get_api_version_hash(self, data):
-        """Generate a hash of the API data to detect changes"""
-        json_str = json.dumps(data, sort_keys=True)
-        return hashlib.md5(json_str.encode()).hexdigest()
-    
-    def _save_cache_info(self, data_hash, timestamp):
+    def _save_cache_info(self, data_hash, timestamp, etag=None, last_modified=None):
         """Save cache metadata information"""
         cache_info = {
             "timestamp": timestamp,
             "data_hash": data_hash,
+            "etag": etag,
+            "last_modified": last_modified,
             "api_url": API_BASE_URL,
-            "cache_version": "1.0"
+            "cache_version": "2.0"
         }
         
         try:
@@ -274,12 +473,21 @@ class CamDBPanel(QtWidgets.QWidget):
         except Exception as e:
             debug_log(f"Error saving cache info: {e}")
     
+    def _save_response_info(self, data_hash, headers=None):
+        """Stamp the cache info with now and the response's ETag/Last-Modified"""
+        import datetime
+        timestamp = datetime.datetime.now().isoformat()
+        etag = headers.get('ETag') if headers else None
+        last_modified = headers.get('Last-Modified') if headers else None
+        self._save_cache_info(data_hash, timestamp, etag, last_modified)
+        self._update_cache_info_display()
+    
     def _load_cache_info(self):
         """Load cache metadata information"""
         try:
             if self.cache_info_file.exists():
-                with open(self.cache_info_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(self.cache_info_file, 'rb') as f:
+                    return _loads(f.read())
         except Exception as e:
             debug_log(f"Error loading cache info: {e}")
         return None
@@ -291,6 +499,8 @@ class CamDBPanel(QtWidgets.QWidget):
         if cache_info and self.cameras_cache_file.exists():
             timestamp = cache_info.get('timestamp', 'Unknown')
             try:
+                import datetime
+                
                 # Parse timestamp and format it nicely
                 dt = datetime.datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
                 formatted_time = dt.strftime('%Y-%m-%d %H:%M:%S')
@@ -321,20 +531,61 @@ class CamDBPanel(QtWidgets.QWidget):
                 timestamp = cache_info.get('timestamp', 'Unknown time')
                 self.status_label.setText(f"Cached data available from {timestamp}")
     
-    def _save_to_cache(self, data):
+    def _open_cache_db(self):
+        """Open the SQLite cache, creating (or recreating outdated) tables if needed"""
+        conn = sqlite3.connect(str(self.cameras_cache_file))
+        if conn.execute("PRAGMA user_version").fetchone()[0] != CACHE_SCHEMA_VERSION:
+            conn.executescript("DROP TABLE IF EXISTS cameras; DROP TABLE IF EXISTS sensors;")
+            conn.execute(f"PRAGMA user_version = {CACHE_SCHEMA_VERSION}")
+        conn.executescript(CACHE_SCHEMA)
+        return conn
+    
+    def _remove_legacy_cache_files(self):
+        """Delete camera cache files left behind by earlier versions"""
+        for name in LEGACY_CACHE_NAMES:
+            legacy_file = self.cache_dir / name
+            if legacy_file.exists():
+                legacy_file.unlink()
+    
+    def _save_to_cache(self, data, data_hash, headers=None):
         """Save camera data to cache with metadata"""
         try:
-            # Save the camera data
-            with open(self.cameras_cache_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            rows = [
+                (position, camera.get('id'), camera.get('make'), camera.get('cam_type'),
+                 camera.get('name'), _dumps(camera))
+                for position, camera in enumerate(data)
+            ]
             
-            # Save cache metadata
-            data_hash = self._get_api_version_hash(data)
-            timestamp = datetime.datetime.now().isoformat()
-            self._save_cache_info(data_hash, timestamp)
+            with closing(self._open_cache_db()) as conn, conn:
+                existing = {
+                    position: (camera_id, bytes(payload))
+                    for position, camera_id, payload in conn.execute("SELECT position, id, payload FROM cameras")
+                }
+                
+                # Only write positions whose camera is new or changed
+                changed = [row for row in rows if existing.get(row[0]) != (row[1], row[5])]
+                stale = max(len(existing) - len(rows), 0)
+                
+                conn.execute("DELETE FROM cameras WHERE position >= ?", (len(rows),))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO cameras (position, id, make, cam_type, name, payload) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    changed
+                )
+                
+                # Sensors of removed or edited cameras may be outdated;
+                # cameras that only moved keep theirs
+                kept = {(row[1], row[5]) for row in rows}
+                outdated = {camera_id for camera_id, payload in existing.values() if (camera_id, payload) not in kept}
+                conn.executemany("DELETE FROM sensors WHERE camera_id = ?", [(camera_id,) for camera_id in outdated])
+                for camera_id in outdated:
+                    self._sensor_cache.pop(camera_id, None)
             
-            debug_log(f"Data cached to {self.cameras_cache_file}")
-            self._update_cache_info_display()
+            self._remove_legacy_cache_files()
+            
+            debug_log(f"Cached {len(changed)} changed and removed {stale} cameras in {self.cameras_cache_file}")
+            
+            self._save_response_info(data_hash, headers)
             
         except Exception as e:
             debug_log(f"Error saving to cache: {e}")
@@ -344,28 +595,58 @@ class CamDBPanel(QtWidgets.QWidget):
         """Load camera data from cache"""
         try:
             if self.cameras_cache_file.exists():
-                with open(self.cameras_cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with closing(self._open_cache_db()) as conn:
+                    return [
+                        _loads(payload)
+                        for (payload,) in conn.execute("SELECT payload FROM cameras ORDER BY position")
+                    ]
         except Exception as e:
             debug_log(f"Error loading from cache: {e}")
         return None
     
-    def _check_cache_freshness(self):
-        """Check if cached data is up to date with API"""
+    def _save_sensors_to_cache(self, sensors_by_camera):
+        """Persist sensor lists keyed by camera id"""
         try:
-            # Get a small sample from API to check version
-            sample_data = self.api_request("/cameras/?limit=1")
-            current_hash = self._get_api_version_hash(sample_data)
-            
-            cache_info = self._load_cache_info()
-            if cache_info:
-                cached_hash = cache_info.get('data_hash', '')
-                return current_hash == cached_hash
-            
+            with closing(self._open_cache_db()) as conn, conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO sensors (camera_id, payload) VALUES (?, ?)",
+                    [(camera_id, _dumps(sensors)) for camera_id, sensors in sensors_by_camera.items()]
+                )
         except Exception as e:
-            debug_log(f"Error checking cache freshness: {e}")
-        
-        return False
+            debug_log(f"Error saving sensors to cache: {e}")
+    
+    def _load_sensors_from_cache(self, camera_id):
+        """Return the cached sensor list for a camera, or None"""
+        try:
+            if self.cameras_cache_file.exists():
+                with closing(self._open_cache_db()) as conn:
+                    row = conn.execute("SELECT payload FROM sensors WHERE camera_id = ?", (camera_id,)).fetchone()
+                    if row:
+                        return _loads(row[0])
+        except Exception as e:
+            debug_log(f"Error loading sensors from cache: {e}")
+        return None
+    
+    def _cached_sensor_ids(self):
+        """Return the ids of all cameras with sensors in the cache"""
+        try:
+            if self.cameras_cache_file.exists():
+                with closing(self._open_cache_db()) as conn:
+                    return {camera_id for (camera_id,) in conn.execute("SELECT camera_id FROM sensors")}
+        except Exception as e:
+            debug_log(f"Error reading cached sensor ids: {e}")
+        return set()
+    
+    def _fetch_if_modified(self, cache_info):
+        """
+        Ask the API whether the cameras changed since the last full fetch.
+        Returns None if the cache is fresh, otherwise the new (data, headers, raw_bytes).
+        """
+        return self.api_request_conditional(
+            "/cameras/",
+            etag=cache_info.get('etag'),
+            last_modified=cache_info.get('last_modified')
+        )
     
     def browse_cache_location(self):
         """Allow user to choose cache location"""
@@ -381,7 +662,7 @@ class CamDBPanel(QtWidgets.QWidget):
             self.cache_dir.mkdir(parents=True, exist_ok=True)
             
             # Update file paths
-            self.cameras_cache_file = self.cache_dir / "camdb_cameras.json"
+            self.cameras_cache_file = self.cache_dir / CAMERAS_CACHE_NAME
             self.cache_info_file = self.cache_dir / "camdb_cache_info.json"
             
             # Update UI
@@ -406,31 +687,70 @@ class CamDBPanel(QtWidgets.QWidget):
     
     def update_cache(self):
         """Update cache with latest data from API"""
-        self.status_label.setText("Updating cache from API...")
+        if self.cameras_cache_file.exists():
+            self.status_label.setText("Checking for updates...")
+        else:
+            self.status_label.setText("Updating cache from API...")
+        self.update_cache_button.setEnabled(False)
         
-        try:
-            # Check if we have the latest version
-            if self.cameras_cache_file.exists():
-                self.status_label.setText("Checking for updates...")
-                if self._check_cache_freshness():
-                    self.status_label.setText("Cache is already up to date!")
-                    return
-            
-            # Fetch fresh data
-            data = self.api_request("/cameras/")
-            camera_data = data if isinstance(data, list) else []
-            
-            # Save to cache
-            self._save_to_cache(camera_data)
-            
-            # Load the data into the UI
-            self.camera_data = camera_data
-            self._populate_filters_and_display()
-            
-            self.status_label.setText(f"Cache updated with {len(self.camera_data)} cameras")
-            
-        except Exception as e:
-            self.status_label.setText(f"Error updating cache: {e}")
+        self._start_worker(
+            self._fetch_cache_update, self._on_cache_updated, self._on_cache_update_error,
+            self.cameras_cache_file.exists()
+        )
+    
+    def _fetch_cache_update(self, has_cache):
+        """
+        Worker side of update_cache: returns None if the server answered 304,
+        and no camera data if the payload matches the cached one
+        """
+        cache_info = (self._load_cache_info() or {}) if has_cache else {}
+        if has_cache:
+            # Conditional GET: a 304 answer costs no body bytes
+            response = self._fetch_if_modified(cache_info)
+            if response is None:
+                return None
+        else:
+            response = self.api_request("/cameras/", full_response=True)
+        
+        data, headers, raw_bytes = response
+        data_hash = _digest(raw_bytes)
+        
+        # Server without ETag/Last-Modified, or new validators for the same
+        # content: compare the payload hashes, keeping the new validators
+        if has_cache and data_hash == cache_info.get('data_hash'):
+            return None, headers, data_hash
+        
+        camera_data = data if isinstance(data, list) else []
+        return camera_data, headers, data_hash
+    
+    def _on_cache_updated(self, result):
+        """Save and display the result of update_cache"""
+        self.update_cache_button.setEnabled(True)
+        
+        if result is None:
+            self.status_label.setText("Cache is already up to date!")
+            return
+        
+        camera_data, headers, data_hash = result
+        if camera_data is None:
+            # Same content: only remember the validators for the next check
+            self._save_response_info(data_hash, headers)
+            self.status_label.setText("Cache is already up to date!")
+            return
+        
+        # Save to cache
+        self._save_to_cache(camera_data, data_hash, headers)
+        
+        # Load the data into the UI
+        self.camera_data = camera_data
+        self._populate_filters_and_display()
+        
+        self.status_label.setText(f"Cache updated with {len(self.camera_data)} cameras")
+    
+    def _on_cache_update_error(self, message):
+        """Re-enable the update button and report the failed cache update"""
+        self.update_cache_button.setEnabled(True)
+        self.status_label.setText(f"Error updating cache: {message}")
     
     def clear_cache(self):
         """Clear cached data"""
@@ -439,14 +759,18 @@ class CamDBPanel(QtWidgets.QWidget):
                 self.cameras_cache_file.unlink()
             if self.cache_info_file.exists():
                 self.cache_info_file.unlink()
+            self._remove_legacy_cache_files()
             
             self.camera_data = []
-            self.filtered_cameras = []
-            self.camera_list.clear()
-            self.make_combo.clear()
-            self.type_combo.clear()
-            self.make_combo.addItem("All Makes")
-            self.type_combo.addItem("All Types")
+            self._filtered_indices = []
+            self._build_search_index()
+            self._sensor_cache.clear()
+            self._camera_model.setRows(self.camera_data, self._filtered_indices)
+            self.on_camera_selected(None, None)
+            self._sorted_makes = []
+            self._sorted_types = []
+            self._set_combo_items(self.make_combo, "All Makes", self._sorted_makes)
+            self._set_combo_items(self.type_combo, "All Types", self._sorted_types)
             
             self._update_cache_info_display()
             self.status_label.setText("Cache cleared")
@@ -454,126 +778,322 @@ class CamDBPanel(QtWidgets.QWidget):
         except Exception as e:
             self.status_label.setText(f"Error clearing cache: {e}")
 
-    def api_request(self, endpoint):
-        """Make API request with proper headers"""
-        url = f"{API_BASE_URL}{endpoint}"
-        
+    def _request_headers(self):
+        """Build the standard API request headers"""
+        return {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept': 'application/json, text/plain, */*',
+            'Accept-Encoding': ACCEPT_ENCODING,
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Connection': 'keep-alive',
+        }
+
+    def _acquire_connection(self):
+        """Take an idle keep-alive connection from the pool, or open a new one"""
         try:
-            req = urllib.request.Request(url)
-            req.add_header('User-Agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-            req.add_header('Accept', 'application/json, text/plain, */*')
-            req.add_header('Accept-Language', 'en-US,en;q=0.9')
-            req.add_header('Connection', 'keep-alive')
-            
-            with urllib.request.urlopen(req) as response:
-                raw_data = response.read()
-                
-                # Handle compression
-                content_encoding = response.info().get('Content-Encoding', '').lower()
-                if content_encoding == 'gzip':
-                    raw_data = gzip.decompress(raw_data)
-                elif content_encoding == 'deflate':
-                    import zlib
-                    raw_data = zlib.decompress(raw_data)
-                
-                encoding = response.info().get_content_charset("utf-8")
-                text_data = raw_data.decode(encoding)
-                return json.loads(text_data)
+            return self._connections.get_nowait()
+        except queue.Empty:
+            pass
+        
+        host = urllib.parse.urlsplit(API_BASE_URL).netloc
+        proxy = urllib.request.getproxies().get('https')
+        if proxy and not urllib.request.proxy_bypass(host):
+            proxy_host, tunnel_headers = _parse_proxy(proxy)
+            conn = http.client.HTTPSConnection(proxy_host, timeout=API_TIMEOUT)
+            conn.set_tunnel(host, headers=tunnel_headers)
+        else:
+            conn = http.client.HTTPSConnection(host, timeout=API_TIMEOUT)
+        return conn
+
+    def _release_connection(self, conn):
+        """Return a connection to the pool, closing it if the pool is full"""
+        try:
+            self._connections.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def _close_connections(self):
+        """Close all idle pooled connections"""
+        while True:
+            try:
+                self._connections.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def closeEvent(self, event):
+        """Drop the pooled API connections when the panel is closed"""
+        self._close_connections()
+        super(CamDBPanel, self).closeEvent(event)
+
+    def _read_json(self, endpoint, headers):
+        """
+        GET the endpoint over a pooled connection.
+        Returns the parsed JSON body, response headers and raw body;
+        raises urllib.error.HTTPError for non-2xx answers.
+        """
+        conn = self._acquire_connection()
+        try:
+            return self._request_json(conn, endpoint, headers)
+        except urllib.error.HTTPError:
+            # The error body was read completely; the connection is still usable
+            raise
+        except Exception:
+            # Unknown connection state: reset it, it reconnects on next use
+            conn.close()
+            raise
+        finally:
+            self._release_connection(conn)
+
+    def _request_json(self, conn, endpoint, headers):
+        """Send the GET on the given connection and read the complete response"""
+        reused = conn.sock is not None
+        try:
+            conn.request("GET", endpoint, headers=headers)
+            response = conn.getresponse()
+        except (http.client.HTTPException, ConnectionError):
+            conn.close()
+            if not reused:
+                raise
+            # The server closed the idle connection; retry once on a fresh one
+            conn.request("GET", endpoint, headers=headers)
+            response = conn.getresponse()
+        
+        # The body must be read completely so the connection can be reused
+        if not 200 <= response.status < 300:
+            body = response.read()
+            raise urllib.error.HTTPError(
+                f"{API_BASE_URL}{endpoint}", response.status, response.reason,
+                response.headers, io.BytesIO(body)
+            )
+        
+        # Decompress straight from the socket; the raw bytes are kept
+        # so they can be hashed without re-serializing the parsed data
+        raw_bytes = self._decoded_body(response).read()
+        return _loads(raw_bytes), response.headers, raw_bytes
+
+    def api_request(self, endpoint, full_response=False):
+        """
+        Make API request with proper headers.
+        With full_response=True returns (data, headers, raw_bytes) instead of just data.
+        """
+        try:
+            response = self._read_json(endpoint, self._request_headers())
+            return response if full_response else response[0]
                 
         except Exception as e:
             raise Exception(f"API request failed: {e}")
 
+    def api_request_conditional(self, endpoint, etag=None, last_modified=None):
+        """
+        Make a conditional API request using the stored validators.
+        Returns None if the server answers 304 Not Modified, otherwise
+        the (data, headers, raw_bytes) of the fresh response.
+        """
+        headers = self._request_headers()
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        
+        try:
+            return self._read_json(endpoint, headers)
+        except urllib.error.HTTPError as http_err:
+            if http_err.code == 304:
+                return None
+            raise Exception(f"API request failed: {http_err}")
+        except Exception as e:
+            raise Exception(f"API request failed: {e}")
+
+    def _decoded_body(self, response):
+        """Return a file-like object yielding the decompressed response body"""
+        content_encoding = response.info().get('Content-Encoding', '').lower()
+        if content_encoding == 'gzip':
+            import gzip
+            return gzip.GzipFile(fileobj=response)
+        elif content_encoding == 'deflate':
+            import zlib
+            return io.BytesIO(zlib.decompress(response.read()))
+        elif content_encoding == 'br' and brotli:
+            return io.BytesIO(brotli.decompress(response.read()))
+        return response
+
+    def _start_worker(self, fn, on_finished, on_error, *args):
+        """Run fn(*args) on the global thread pool, reporting back via slots"""
+        worker = ApiWorker(fn, *args)
+        worker.signals.finished.connect(on_finished)
+        worker.signals.error.connect(on_error)
+        QtCore.QThreadPool.globalInstance().start(worker)
+
     def load_all_cameras(self):
         """Load all cameras from the API"""
         self.status_label.setText("Loading cameras from API...")
         self.load_all_button.setEnabled(False)
         
-        try:
-            # Load cameras from API
-            data = self.api_request("/cameras/")
-            self.camera_data = data if isinstance(data, list) else []
-            
-            # Save to cache
-            self._save_to_cache(self.camera_data)
-            
-            # Populate UI
-            self._populate_filters_and_display()
-            
-            self.status_label.setText(f"Loaded {len(self.camera_data)} cameras from API")
-            
-        except Exception as e:
-            self.status_label.setText(f"Error loading cameras: {e}")
+        self._start_worker(self._fetch_cameras, self._on_cameras_loaded, self._on_cameras_error)
+    
+    def _fetch_cameras(self):
+        """Worker side of load_all_cameras"""
+        data, headers, raw_bytes = self.api_request("/cameras/", full_response=True)
+        camera_data = data if isinstance(data, list) else []
+        return camera_data, headers, _digest(raw_bytes)
+    
+    def _on_cameras_loaded(self, result):
+        """Save and display the cameras fetched by load_all_cameras"""
+        self.load_all_button.setEnabled(True)
+        self.camera_data, headers, data_hash = result
         
-        finally:
-            self.load_all_button.setEnabled(True)
+        # Save to cache
+        self._save_to_cache(self.camera_data, data_hash, headers)
+        
+        # Populate UI
+        self._populate_filters_and_display()
+        
+        self.status_label.setText(f"Loaded {len(self.camera_data)} cameras from API")
+    
+    def _on_cameras_error(self, message):
+        """Re-enable the load button and report the failed camera fetch"""
+        self.load_all_button.setEnabled(True)
+        self.status_label.setText(f"Error loading cameras: {message}")
     
+    def _build_search_index(self):
+        """Precompute the casefolded names, makes and types filtered on every keystroke"""
+        self._names_lc = [(c.get('name') or '').casefold() for c in self.camera_data]
+        self._makes = [c.get('make') for c in self.camera_data]
+        self._types = [c.get('cam_type') for c in self.camera_data]
+
+    def _set_combo_items(self, combo, all_label, items):
+        """Refill a filter combo in one batch without triggering filter_cameras"""
+        current = combo.currentText()
+        combo.blockSignals(True)
+        try:
+            combo.clear()
+            combo.addItem(all_label)
+            combo.addItems(items)
+            # Keep the user's choice if it is still offered
+            index = combo.findText(current)
+            if index > 0:
+                combo.setCurrentIndex(index)
+        finally:
+            combo.blockSignals(False)
+
     def _populate_filters_and_display(self):
         """Populate filter dropdowns and display cameras"""
-        # Populate filter dropdowns
-        makes = set()
-        types = set()
-        
-        for camera in self.camera_data:
-            if camera.get('make'):
-                makes.add(camera['make'])
-            if camera.get('cam_type'):
-                types.add(camera['cam_type'])
-        
-        # Update make combo
-        self.make_combo.clear()
-        self.make_combo.addItem("All Makes")
-        for make in sorted(makes):
-            self.make_combo.addItem(make)
-        
-        # Update type combo
-        self.type_combo.clear()
-        self.type_combo.addItem("All Types")
-        for cam_type in sorted(types):
-            self.type_combo.addItem(cam_type)
+        self._build_search_index()
+        
+        # Distinct makes and types straight from the precomputed columns
+        makes = set(self._makes)
+        types = set(self._types)
+        makes.difference_update((None, ''))
+        types.difference_update((None, ''))
+        sorted_makes = sorted(makes)
+        sorted_types = sorted(types)
+        
+        # Only rebuild a combo when its list actually changed
+        if sorted_makes != self._sorted_makes:
+            self._sorted_makes = sorted_makes
+            self._set_combo_items(self.make_combo, "All Makes", sorted_makes)
+        if sorted_types != self._sorted_types:
+            self._sorted_types = sorted_types
+            self._set_combo_items(self.type_combo, "All Types", sorted_types)
         
         # Filter and display cameras
         self.filter_cameras()
+        
+        self._prefetch_sensors()
+    
+    def _prefetch_sensors(self):
+        """Fetch sensor data for the first listed cameras in the background"""
+        if not self.prefetch_sensors_check.isChecked():
+            return
+        
+        cached_ids = self._cached_sensor_ids()
+        camera_ids = []
+        for i in self._filtered_indices:
+            camera_id = self.camera_data[i].get('id')
+            if (camera_id and camera_id not in self._sensor_cache and camera_id not in cached_ids
+                    and camera_id not in self._sensor_requests):
+                camera_ids.append(camera_id)
+            if len(camera_ids) >= SENSOR_PREFETCH_LIMIT:
+                break
+        
+        if camera_ids:
+            debug_log(f"Prefetching sensors for {len(camera_ids)} cameras")
+            self._sensor_requests.update(camera_ids)
+            self._update_load_sensors_button()
+            self._start_worker(
+                self._fetch_sensor_batch,
+                functools.partial(self._on_sensors_prefetched, camera_ids),
+                functools.partial(self._on_sensors_prefetch_error, camera_ids),
+                camera_ids
+            )
+    
+    def _fetch_sensor_batch(self, camera_ids):
+        """Worker side of _prefetch_sensors: fetch several cameras in parallel"""
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=SENSOR_PREFETCH_WORKERS)
+        futures = {executor.submit(self._fetch_sensors, cid): cid for cid in camera_ids}
+        done, not_done = concurrent.futures.wait(futures, timeout=SENSOR_PREFETCH_TIMEOUT)
+        
+        # Give up on whatever did not make it in time
+        for future in not_done:
+            future.cancel()
+        executor.shutdown(wait=False)
+        
+        results = {}
+        for future in done:
+            if future.exception() is None:
+                camera_id, sensors = future.result()
+                results[camera_id] = sensors
+            else:
+                debug_log(f"Sensor prefetch failed for camera {futures[future]}: {future.exception()}")
+        return results
+    
+    def _on_sensors_prefetched(self, camera_ids, results):
+        """Cache the sensors fetched in the background for the listed cameras"""
+        self._sensor_requests.difference_update(camera_ids)
+        self._update_load_sensors_button()
+        for camera_id, sensors in results.items():
+            self._remember_sensors(camera_id, sensors)
+        self._save_sensors_to_cache(results)
+    
+    def _on_sensors_prefetch_error(self, camera_ids, message):
+        """Log a failed prefetch; sensors are fetched on demand instead"""
+        self._sensor_requests.difference_update(camera_ids)
+        self._update_load_sensors_button()
+        debug_log(f"Sensor prefetch failed: {message}")
+
+    def _schedule_filter(self, text=None):
+        """(Re)start the search debounce timer"""
+        self._filter_timer.start()
 
     def filter_cameras(self):
         """Filter cameras based on selected criteria"""
-        if not self.camera_data:
-            return
-        
+        # No early return on empty data: the indices and the model must
+        # always be rebuilt so no stale row points past camera_data
         selected_make = self.make_combo.currentText()
         selected_type = self.type_combo.currentText()
-        search_text = self.search_edit.text().lower()
+        search_text = self.search_edit.text().casefold()
         
-        self.filtered_cameras = []
+        filter_make = selected_make != "All Makes"
+        filter_type = selected_type != "All Types"
         
-        for camera in self.camera_data:
-            # Filter by make
-            if selected_make != "All Makes" and camera.get('make') != selected_make:
-                continue
-            
-            # Filter by type
-            if selected_type != "All Types" and camera.get('cam_type') != selected_type:
-                continue
-            
-            # Filter by search text
-            if search_text and search_text not in camera.get('name', '').lower():
-                continue
-            
-            self.filtered_cameras.append(camera)
-        
-        # Update camera list
-        self.camera_list.clear()
-        for camera in self.filtered_cameras:
-            name = camera.get('name', 'Unknown')
-            make = camera.get('make', 'Unknown')
-            item_text = f"{make} - {name}"
-            item = QtWidgets.QListWidgetItem(item_text)
-            item.setData(QtCore.Qt.UserRole, camera)
-            self.camera_list.addItem(item)
+        # Scan the flat columns; only matching indices touch the camera dicts
+        self._filtered_indices = [
+            i for i, (name, make, cam_type) in enumerate(zip(self._names_lc, self._makes, self._types))
+            if (not filter_make or make == selected_make)
+            and (not filter_type or cam_type == selected_type)
+            and search_text in name
+        ]
+        
+        # One model reset instead of one item per camera
+        self._camera_model.setRows(self.camera_data, self._filtered_indices)
+        
+        # A model reset drops the current index without notifying
+        self.on_camera_selected(None, None)
 
     def on_camera_selected(self, current, previous):
         """Handle camera selection"""
-        if current:
-            self.selected_camera = current.data(QtCore.Qt.UserRole)
+        if current is not None and current.isValid():
+            self.selected_camera = self.camera_data[current.data(QtCore.Qt.UserRole)]
             
             # Display camera info
             info = f"ID: {self.selected_camera.get('id', 'N/A')}\n"
@@ -582,7 +1102,7 @@ class CamDBPanel(QtWidgets.QWidget):
             info += f"Type: {self.selected_camera.get('cam_type', 'N/A')}"
             
             self.camera_info.setPlainText(info)
-            self.load_sensors_button.setEnabled(True)
+            self._update_load_sensors_button()
             
             # Clear sensor data
             self.sensor_list.clear()
@@ -602,47 +1122,110 @@ class CamDBPanel(QtWidgets.QWidget):
         if not camera_id:
             return
         
+        # Prefetched or previously viewed: no request needed
+        if camera_id in self._sensor_cache:
+            self._sensor_cache.move_to_end(camera_id)
+            self.sensor_data = self._sensor_cache[camera_id]
+            self._populate_sensor_list()
+            return
+        
+        cached_sensors = self._load_sensors_from_cache(camera_id)
+        if cached_sensors is not None:
+            self._remember_sensors(camera_id, cached_sensors)
+            self.sensor_data = cached_sensors
+            self._populate_sensor_list()
+            return
+        
+        # Already being fetched: its result is shown when it arrives
+        if camera_id in self._sensor_requests:
+            return
+        
         self.status_label.setText("Loading sensor data...")
-        self.load_sensors_button.setEnabled(False)
+        self._sensor_requests.add(camera_id)
+        self._update_load_sensors_button()
         
-        try:
-            # Debug: Show what we're requesting
-            endpoint = f"/cameras/{camera_id}/sensors/"
-            debug_log(f"Requesting: {endpoint}")
-            
-            data = self.api_request(endpoint)
-            
-            # Debug: Show raw response
-            debug_log(f"Raw sensor response: {data}")
-            
-            # Handle different response formats
-            if isinstance(data, dict):
-                # Check if it's wrapped in a 'sensors' key or similar
-                if 'sensors' in data:
-                    self.sensor_data = data['sensors']
-                elif 'data' in data:
-                    self.sensor_data = data['data']
-                elif 'results' in data:
-                    self.sensor_data = data['results']
-                else:
-                    # Might be a single sensor object, wrap in list
-                    self.sensor_data = [data]
-            elif isinstance(data, list):
-                self.sensor_data = data
+        self._start_worker(
+            self._fetch_sensors, self._on_sensors_loaded,
+            functools.partial(self._on_sensors_error, camera_id), camera_id
+        )
+
+    def _update_load_sensors_button(self):
+        """Enable Load Sensor Data unless the selected camera is already being fetched"""
+        self.load_sensors_button.setEnabled(
+            bool(self.selected_camera) and self.selected_camera.get('id') not in self._sensor_requests
+        )
+
+    def _remember_sensors(self, camera_id, sensors):
+        """Add sensors to the in-memory LRU, evicting the least recently used"""
+        self._sensor_cache[camera_id] = sensors
+        self._sensor_cache.move_to_end(camera_id)
+        if len(self._sensor_cache) > SENSOR_CACHE_SIZE:
+            self._sensor_cache.popitem(last=False)
+
+    def _fetch_sensors(self, camera_id):
+        """Worker side of load_sensor_data: returns (camera_id, sensors)"""
+        endpoint = f"/cameras/{camera_id}/sensors/"
+        debug_log(f"Requesting: {endpoint}")
+        
+        data = self.api_request(endpoint)
+        
+        # Debug: Show raw response
+        debug_log(f"Raw sensor response: {data}")
+        
+        return camera_id, self._extract_sensor_list(data)
+
+    def _on_sensors_loaded(self, result):
+        """Cache fetched sensors and show them if the camera is still selected"""
+        camera_id, sensors = result
+        self._sensor_requests.discard(camera_id)
+        self._update_load_sensors_button()
+        self._remember_sensors(camera_id, sensors)
+        self._save_sensors_to_cache({camera_id: sensors})
+        
+        if not self.selected_camera or self.selected_camera.get('id') != camera_id:
+            self.status_label.setText(f"Loaded {len(sensors)} sensor configurations for camera {camera_id}")
+            return
+        
+        self.sensor_data = sensors
+        debug_log(f"Processed sensor data: {self.sensor_data}")
+        self._populate_sensor_list()
+
+    def _on_sensors_error(self, camera_id, message):
+        """Re-enable the sensors button and report the failed sensor fetch"""
+        self._sensor_requests.discard(camera_id)
+        self._update_load_sensors_button()
+        self.status_label.setText(f"Error loading sensors: {message}")
+        print(f"Error loading sensors: {message}")
+
+    def _extract_sensor_list(self, data):
+        """Normalize the different sensor response formats into a list"""
+        if isinstance(data, dict):
+            # Check if it's wrapped in a 'sensors' key or similar
+            if 'sensors' in data:
+                return data['sensors']
+            elif 'data' in data:
+                return data['data']
+            elif 'results' in data:
+                return data['results']
             else:
-                self.sensor_data = []
-            
-            debug_log(f"Processed sensor data: {self.sensor_data}")
-            
-            # Populate sensor list
-            self.sensor_list.clear()
-            
-            if not self.sensor_data:
-                item = QtWidgets.QListWidgetItem("No sensor data available")
-                self.sensor_list.addItem(item)
-                self.status_label.setText("No sensor configurations found")
-                return
-            
+                # Might be a single sensor object, wrap in list
+                return [data]
+        elif isinstance(data, list):
+            return data
+        return []
+
+    def _populate_sensor_list(self):
+        """Fill the sensor list from self.sensor_data"""
+        self.sensor_list.clear()
+        
+        if not self.sensor_data:
+            item = QtWidgets.QListWidgetItem("No sensor data available")
+            self.sensor_list.addItem(item)
+            self.status_label.setText("No sensor configurations found")
+            return
+        
+        self.sensor_list.setUpdatesEnabled(False)
+        try:
             for i, sensor in enumerate(self.sensor_data):
                 debug_log(f"Processing sensor {i}: {sensor}")
                 
@@ -659,27 +1242,10 @@ class CamDBPanel(QtWidgets.QWidget):
                 item = QtWidgets.QListWidgetItem(item_text)
                 item.setData(QtCore.Qt.UserRole, sensor)
                 self.sensor_list.addItem(item)
-            
-            self.status_label.setText(f"Loaded {len(self.sensor_data)} sensor configurations")
-            
-        except urllib.error.HTTPError as http_err:
-            error_msg = f"HTTP {http_err.code}: {http_err.reason}"
-            try:
-                error_body = http_err.read().decode('utf-8')
-                error_msg += f"\nResponse: {error_body}"
-            except:
-                pass
-            self.status_label.setText(f"HTTP Error: {error_msg}")
-            debug_log(f"HTTP Error loading sensors: {error_msg}")
-            
-        except Exception as e:
-            self.status_label.setText(f"Error loading sensors: {e}")
-            print(f"Error loading sensors: {e}")
-            import traceback
-            traceback.print_exc()
-        
         finally:
-            self.load_sensors_button.setEnabled(True)
+            self.sensor_list.setUpdatesEnabled(True)
+        
+        self.status_label.setText(f"Loaded {len(self.sensor_data)} sensor configurations")
 
     def on_sensor_selected(self, current, previous):
         """Handle sensor selection"""
@@ -700,101 +1266,143 @@ class CamDBPanel(QtWidgets.QWidget):
             self.sensor_info.clear()
             self.create_camera_button.setEnabled(False)
 
+    def _save_auto_look_through(self, checked):
+        """Remember the Auto look-through choice between sessions"""
+        QtCore.QSettings(SETTINGS_ORG, SETTINGS_APP).setValue("auto_look_through", checked)
+
+    def _save_prefetch_sensors(self, checked):
+        """Remember the Prefetch sensors choice between sessions"""
+        QtCore.QSettings(SETTINGS_ORG, SETTINGS_APP).setValue("prefetch_sensors", checked)
+
+    def _get_scene_viewer(self):
+        """Return the cached Scene Viewer, looking it up again once its pane is gone"""
+        import hou
+        
+        viewer = self._scene_viewer_cache
+        if viewer is not None:
+            try:
+                if isinstance(viewer, hou.SceneViewer) and viewer.pane() is not None:
+                    return viewer
+            except hou.ObjectWasDeleted:
+                pass
+        
+        self._scene_viewer_cache = hou.ui.paneTabOfType(self._scene_viewer_type)
+        return self._scene_viewer_cache
+
     def create_houdini_camera(self):
         """Create a camera in Houdini with the selected settings"""
+        import hou
+        display_message = hou.ui.displayMessage
+        
         if not self.selected_camera:
-            hou.ui.displayMessage("No camera selected")
+            display_message("No camera selected")
             return
         
         current_sensor_item = self.sensor_list.currentItem()
         if not current_sensor_item:
-            hou.ui.displayMessage("No sensor configuration selected")
+            display_message("No sensor configuration selected")
             return
         
         sensor = current_sensor_item.data(QtCore.Qt.UserRole)
         
         try:
-            # Get current scene's object level
-            obj = hou.node("/obj")
-            
-            # Create camera name
-            camera_name = f"{self.selected_camera.get('make', 'Unknown')}_{self.selected_camera.get('name', 'Camera')}"
-            camera_name = camera_name.replace(' ', '_').replace('-', '_')
-            
+            cam_node = self._build_camera_node(self.selected_camera, sensor)
+        except (hou.OperationFailed, hou.PermissionError, ValueError) as e:
+            # Show the error once the creation call chain has returned
+            self.status_label.setText(f"Error creating camera: {e}")
+            QtCore.QTimer.singleShot(0, functools.partial(display_message, f"Error creating camera: {e}"))
+            return
+        
+        self.status_label.setText(f"Created camera: {cam_node.name()}")
+        
+        # Ask if user wants to look through the camera, unless they always do
+        if self.auto_look_through_check.isChecked() or display_message(
+                "Camera created successfully! Look through it now?", buttons=("Yes", "No")) == 0:
+            # Set the camera as the current viewport camera
+            scene_viewer = self._get_scene_viewer()
+            if scene_viewer:
+                scene_viewer.curViewport().setCamera(cam_node)
+
+    def _build_camera_node(self, camera, sensor):
+        """Create and configure the camera node; raises on Houdini or data errors"""
+        import hou
+        
+        # Get current scene's object level
+        obj = hou.node("/obj")
+        
+        # Create camera name
+        camera_name = f"{camera.get('make', 'Unknown')}_{camera.get('name', 'Camera')}"
+        camera_name = camera_name.replace(' ', '_').replace('-', '_')
+        
+        # One undo entry for the whole creation
+        with hou.undos.group("Create CamDB Camera"):
             # Create the camera
             cam_node = obj.createNode("cam", camera_name)
             
             # Set camera parameters based on sensor data
             if sensor.get('res_width') and sensor.get('res_height'):
-                cam_node.parm("resx").set(int(sensor['res_width']))
-                cam_node.parm("resy").set(int(sensor['res_height']))
+                cam_node.parmTuple("res").set((int(sensor['res_width']), int(sensor['res_height'])))
             
+            # Position, aperture and aspect are applied in a single setParms call;
+            # the camera sits slightly away from the origin
+            parms = {"tx": 0, "ty": 0, "tz": 5}
             if sensor.get('sensor_width'):
-            
                 # Convert sensor width
-                aperture_houdini = (float(sensor['sensor_width']) / 36.0) * 41.4214
-                cam_node.parm("aperture").set(aperture_houdini)
+                parms["aperture"] = (float(sensor['sensor_width']) / 36.0) * 41.4214
             
             # Set aspect ratio if available
             if sensor.get('format_aspect'):
                 try:
-                    aspect = float(sensor['format_aspect'])
-                    cam_node.parm("aspect").set(aspect)
+                    parms["aspect"] = float(sensor['format_aspect'])
                 except (ValueError, TypeError):
                     pass
             
+            cam_node.setParms(parms)
+            
             # Add camera info to the comment
-            comment = f"CamDB Camera: {self.selected_camera.get('make')} {self.selected_camera.get('name')}\n"
-            comment += f"Mode: {sensor.get('mode_name', 'N/A')}\n"
-            comment += f"Sensor: {sensor.get('sensor_width')}x{sensor.get('sensor_height')}mm\n"
-            comment += f"Resolution: {sensor.get('res_width')}x{sensor.get('res_height')}"
+            sensor_get = sensor.get
+            comment = (
+                f"CamDB Camera: {camera.get('make')} {camera.get('name')}\n"
+                f"Mode: {sensor_get('mode_name', 'N/A')}\n"
+                f"Sensor: {sensor_get('sensor_width')}x{sensor_get('sensor_height')}mm\n"
+                f"Resolution: {sensor_get('res_width')}x{sensor_get('res_height')}"
+            )
             
             cam_node.setComment(comment)
-            cam_node.setGenericFlag(hou.nodeFlag.DisplayComment, True)
-            
-            # Position camera slightly away from origin
-            cam_node.parmTuple("t").set((0, 0, 5))
+            cam_node.setGenericFlag(self._display_comment_flag, True)
             
             # Layout nodes
             cam_node.moveToGoodPosition()
-            
-            self.status_label.setText(f"Created camera: {camera_name}")
-            
-            # Ask if user wants to look through the camera
-            if hou.ui.displayMessage("Camera created successfully! Look through it now?", 
-                                   buttons=("Yes", "No")) == 0:
-                # Set the camera as the current viewport camera
-                scene_viewer = hou.ui.paneTabOfType(hou.paneTabType.SceneViewer)
-                if scene_viewer:
-                    scene_viewer.curViewport().setCamera(cam_node)
-            
-        except Exception as e:
-            hou.ui.displayMessage(f"Error creating camera: {e}")
-            self.status_label.setText(f"Error creating camera: {e}")
+        
+        return cam_node
 
 def show_camdb_floating():
     """
     Instantiate (or re-show) CamDBPanel as a floating window.
-    Keeps a global camdb_win reference so it doesn't get garbage-collected.
+    The window is parented to Houdini's main window and tracked through a weak reference.
     """
-    global camdb_win
+    global _camdb_win_ref
+    import hou
     
-    # If it's already open & visible, just bring it forward
-    if camdb_win:
-        if camdb_win.isVisible():
-            camdb_win.raise_()
-            camdb_win.activateWindow()
-            return
-        else:
+    # If it already exists, just show it and bring it forward
+    camdb_win = _camdb_win_ref() if _camdb_win_ref else None
+    if camdb_win is not None:
+        try:
             camdb_win.show()
             camdb_win.raise_()
             camdb_win.activateWindow()
             return
+        except RuntimeError:
+            # The C++ widget was deleted before the wrapper went away
+            pass
     
     # Otherwise, create it anew
     parent = hou.ui.mainQtWindow()
-    camdb_win = CamDBPanel(parent)
-    camdb_win.setWindowFlags(QtCore.Qt.Window)
+    camdb_win = CamDBPanel()
+    camdb_win.setParent(parent, QtCore.Qt.Window)
+    camdb_win.setAttribute(QtCore.Qt.WA_DeleteOnClose, False)
+    camdb_win.destroyed.connect(_forget_camdb_win)
+    _camdb_win_ref = weakref.ref(camdb_win)
     camdb_win.show()
 
 # Execute immediately when the shelf tool is clicked